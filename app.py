@@ -1,14 +1,22 @@
+import atexit
+
 from flask import Flask, render_template, request
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 from src.pipeline import predict_pipeline
 from src.pipeline.predict_pipeline import MyData, PredictPipeline
+from src.pipeline.prediction_log import PredictionLogger
 
 application = Flask(__name__)
 
 app = application
 
+# Journal d'audit des prédictions (vidé sur disque par un thread en arrière-plan,
+# démarré au premier appel dans chaque processus ; voir aussi gunicorn.conf.py)
+prediction_logger = PredictionLogger()
+atexit.register(prediction_logger.close)
+
 
 @app.route('/')
 def index():
@@ -29,13 +37,10 @@ def predict():
         )
 
         pred_df = data.get_data_as_data_frame()
-        print(pred_df)
-        print("Before Prediction")
 
         predict_pipeline = PredictPipeline()
-        print("Mid Prediction")
         results = predict_pipeline.predict(pred_df)
-        print("after Prediction")
+        prediction_logger.log(data, results[0], model_version=predict_pipeline.model_version)
         return render_template('home.html', results=results[0])
 
 if __name__=="__main__":
@@ -0,0 +1,145 @@
+"""
+Compare le mode par défaut et le mode compact de `DataTransformation`.
+
+Génère un jeu synthétique (par ré-échantillonnage de `stud.csv`), puis mesure pour chaque mode :
+- la mémoire maximale (tracemalloc) pendant `initiate_data_transformation` ;
+- la mémoire en régime établi (DataFrames lus + matrices produites) ;
+- le débit de lecture, de `initiate_data_transformation` complet et de la transformation
+  seule (durée complète moins la durée de lecture) en lignes/s ;
+- le R² obtenu sur le jeu de test, pour vérifier l'écart de précision.
+
+Usage :
+    python -m benchmarks.compact_dtypes --rows 1000000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+
+from src.components.data_transformation import DataTransformation, DataTransformationConfig
+from src.schema import read_dataset
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'notebook', 'data', 'stud.csv')
+
+
+def make_dataset(n_rows: int, out_dir: str, seed: int = 42):
+    """Ré-échantillonne `stud.csv` jusqu'à `n_rows` lignes et écrit les CSV train/test."""
+    df = pd.read_csv(SOURCE_PATH)
+    df = df.sample(n=n_rows, replace=True, random_state=seed).reset_index(drop=True)
+    train_set, test_set = train_test_split(df, test_size=0.2, random_state=seed)
+    train_path = os.path.join(out_dir, 'train.csv')
+    test_path = os.path.join(out_dir, 'test.csv')
+    train_set.to_csv(train_path, index=False)
+    test_set.to_csv(test_path, index=False)
+    return train_path, test_path
+
+
+def run_mode(train_path: str, test_path: str, compact: bool, out_dir: str) -> dict:
+    """Exécute `initiate_data_transformation` dans un mode donné et retourne les mesures."""
+    config = DataTransformationConfig(
+        preprocessor_obj_file_path=os.path.join(out_dir, f'preprocessor_{compact}.pkl'),
+        compact=compact,
+    )
+
+    # Lecture seule, pour le débit de lecture et la mémoire des DataFrames
+    start_time = time.perf_counter()
+    train_df = read_dataset(train_path, compact=compact)
+    test_df = read_dataset(test_path, compact=compact)
+    read_time = time.perf_counter() - start_time
+    n_rows = len(train_df) + len(test_df)
+    frames_bytes = int(train_df.memory_usage(deep=True).sum() + test_df.memory_usage(deep=True).sum())
+    del train_df, test_df
+
+    # Chemin réel : lecture, transformation et sauvegarde du préprocesseur
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    train_arr, test_arr, _ = DataTransformation(config).initiate_data_transformation(train_path, test_path)
+    pipeline_time = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    arrays_bytes = int(train_arr.nbytes + test_arr.nbytes)
+
+    model = LinearRegression().fit(train_arr[:, :-1], train_arr[:, -1])
+    r2 = r2_score(test_arr[:, -1], model.predict(test_arr[:, :-1]))
+
+    return {
+        'compact': compact,
+        'rows': n_rows,
+        'dtype': str(train_arr.dtype),
+        'peak_mb': peak / 1e6,
+        'steady_frames_mb': frames_bytes / 1e6,
+        'steady_arrays_mb': arrays_bytes / 1e6,
+        'read_rows_per_s': n_rows / read_time,
+        'pipeline_rows_per_s': n_rows / pipeline_time,
+        'transform_rows_per_s': n_rows / max(pipeline_time - read_time, 1e-9),
+        'linear_r2': r2,
+    }
+
+
+def accuracy_check(out_dir: str) -> dict:
+    """Compare le R² des deux modes sur le vrai jeu `stud.csv` (découpage 80/20)."""
+    df = pd.read_csv(SOURCE_PATH)
+    train_set, test_set = train_test_split(df, test_size=0.2, random_state=42)
+    train_path = os.path.join(out_dir, 'stud_train.csv')
+    test_path = os.path.join(out_dir, 'stud_test.csv')
+    train_set.to_csv(train_path, index=False)
+    test_set.to_csv(test_path, index=False)
+
+    scores = {}
+    for compact in (False, True):
+        config = DataTransformationConfig(
+            preprocessor_obj_file_path=os.path.join(out_dir, f'stud_preprocessor_{compact}.pkl'),
+            compact=compact,
+        )
+        train_arr, test_arr, _ = DataTransformation(config).initiate_data_transformation(train_path, test_path)
+        for name, model in (
+            ("Linear Regression", LinearRegression()),
+            ("Random Forest", RandomForestRegressor(n_estimators=100, random_state=42)),
+        ):
+            model.fit(train_arr[:, :-1], train_arr[:, -1])
+            scores.setdefault(name, {})[compact] = r2_score(test_arr[:, -1], model.predict(test_arr[:, :-1]))
+
+    return {
+        name: {'default_r2': s[False], 'compact_r2': s[True], 'abs_diff': abs(s[False] - s[True])}
+        for name, s in scores.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du mode compact de DataTransformation")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Nombre de lignes du jeu synthétique")
+    parser.add_argument('--output', default=None, help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        train_path, test_path = make_dataset(args.rows, out_dir)
+        results = {
+            'modes': [run_mode(train_path, test_path, compact, out_dir) for compact in (False, True)],
+            'accuracy': accuracy_check(out_dir),
+        }
+
+    for r in results['modes']:
+        print(
+            f"compact={r['compact']!s:<5} dtype={r['dtype']:<8} rows={r['rows']} "
+            f"peak={r['peak_mb']:.1f} Mo frames={r['steady_frames_mb']:.1f} Mo arrays={r['steady_arrays_mb']:.1f} Mo "
+            f"read={r['read_rows_per_s']:.0f} l/s pipeline={r['pipeline_rows_per_s']:.0f} l/s transform={r['transform_rows_per_s']:.0f} l/s R²={r['linear_r2']:.6f}"
+        )
+    for name, s in results['accuracy'].items():
+        print(f"{name}: R² défaut={s['default_r2']:.6f} compact={s['compact_r2']:.6f} écart={s['abs_diff']:.2e}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
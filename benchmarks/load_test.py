@@ -0,0 +1,372 @@
+"""
+Test de charge HTTP des points d'accès de prédiction.
+
+Démarre l'application localement (ou cible une URL existante), génère des requêtes
+réalistes à partir des distributions de `stud.csv` et envoie un débit imposé
+(boucle ouverte : les envois ne dépendent pas des réponses) avec une concurrence
+bornée. Pour chaque débit, l'outil mesure le débit obtenu, les percentiles de latence
+et le taux d'erreur, puis enregistre la courbe de saturation au format JSON.
+
+La latence est mesurée depuis l'instant d'envoi planifié : le temps passé en file
+d'attente lorsque tous les workers sont occupés est donc compté.
+
+Usage :
+    # Serveur de développement démarré par l'outil
+    python -m benchmarks.load_test --rates 5,10,20,50 --output dev.json
+
+    # Serveur multi-workers
+    python -m benchmarks.load_test --command "gunicorn -w 4 -b 127.0.0.1:5000 app:app" --label gunicorn-4 --output gunicorn.json
+
+    # Point d'accès par lots déjà démarré (corps JSON de 32 enregistrements)
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --endpoint /predict_batch --mode json --batch-size 32
+
+    # Comparaison de plusieurs configurations
+    python -m benchmarks.load_test --compare dev.json gunicorn.json
+"""
+import argparse
+import csv
+import http.client
+import json
+import math
+import os
+import queue
+import random
+import shlex
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from collections import Counter
+
+from src.columns import CATEGORICAL_COLUMNS
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_PATH = os.path.join(ROOT_DIR, 'notebook', 'data', 'stud.csv')
+
+# Noms des champs du formulaire HTML (templates/home.html) lorsqu'ils diffèrent des colonnes
+FORM_FIELDS = {"race_ethnicity": "ethnicity"}
+
+
+class PayloadGenerator:
+    """
+    Génère des données d'élèves suivant les distributions observées dans `stud.csv`.
+
+    Les variables catégoriques suivent leurs fréquences marginales ; les couples
+    (reading_score, writing_score) sont tirés parmi les lignes réelles, avec un léger
+    bruit, pour conserver leur forte corrélation.
+    """
+
+    def __init__(self, source_path: str = SOURCE_PATH, seed: int = None):
+        self.random = random.Random(seed)
+        with open(source_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
+        self.categories = {}
+        for column in CATEGORICAL_COLUMNS:
+            counts = Counter(row[column] for row in rows)
+            self.categories[column] = (list(counts), list(counts.values()))
+        self.scores = [(int(row["reading_score"]), int(row["writing_score"])) for row in rows]
+
+    def record(self) -> dict:
+        """Retourne un enregistrement aléatoire avec les noms de colonnes du jeu de données."""
+        data = {
+            column: self.random.choices(values, weights)[0]
+            for column, (values, weights) in self.categories.items()
+        }
+        reading, writing = self.random.choice(self.scores)
+        data["reading_score"] = min(100, max(0, reading + self.random.randint(-2, 2)))
+        data["writing_score"] = min(100, max(0, writing + self.random.randint(-2, 2)))
+        return data
+
+    def form_body(self) -> bytes:
+        """Corps `application/x-www-form-urlencoded` attendu par `/predict`."""
+        record = {FORM_FIELDS.get(k, k): v for k, v in self.record().items()}
+        return urllib.parse.urlencode(record).encode()
+
+    def json_body(self, batch_size: int) -> bytes:
+        """Corps JSON contenant une liste de `batch_size` enregistrements."""
+        return json.dumps([self.record() for _ in range(batch_size)]).encode()
+
+
+def percentile(sorted_values, q: float) -> float:
+    """Percentile `q` (0-100) par rang le plus proche d'une liste déjà triée."""
+    if not sorted_values:
+        return float('nan')
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def latency_summary(requests) -> dict:
+    """Moyenne, percentiles et maximum (ms) des latences de requêtes `(planifiée, terminée, ...)`."""
+    latencies = sorted((finished - scheduled) * 1000 for scheduled, finished, _, _ in requests)
+    return {
+        "mean": sum(latencies) / len(latencies) if latencies else float('nan'),
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": latencies[-1] if latencies else float('nan'),
+    }
+
+
+class LoadTester:
+    """
+    Envoie des requêtes à débit imposé vers un point d'accès HTTP.
+
+    Methods:
+        run_step(rate, duration): Exécute un palier à débit constant et retourne ses mesures.
+    """
+
+    def __init__(self, url: str, endpoint: str, generator: PayloadGenerator, mode: str = "form",
+                 batch_size: int = 1, concurrency: int = 16, arrivals: str = "poisson",
+                 timeout: float = 30.0, drain_timeout: float = 30.0):
+        parsed = urllib.parse.urlparse(url)
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.https = parsed.scheme == "https"
+        self.endpoint = endpoint
+        self.generator = generator
+        self.mode = mode
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.arrivals = arrivals
+        self.timeout = timeout
+        self.drain_timeout = drain_timeout
+
+        if mode == "form":
+            self.content_type = "application/x-www-form-urlencoded"
+        else:
+            self.content_type = "application/json"
+
+    def _body(self) -> bytes:
+        if self.mode == "form":
+            return self.generator.form_body()
+        return self.generator.json_body(self.batch_size)
+
+    def _connect(self):
+        connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def _worker(self, jobs: queue.Queue, results: list, lock: threading.Lock, stop: threading.Event):
+        connection = self._connect()
+        while not stop.is_set():
+            job = jobs.get()
+            if job is None:
+                break
+            scheduled_at, body = job
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0 and stop.wait(delay):
+                break
+
+            status, error = None, None
+            try:
+                connection.request("POST", self.endpoint, body=body, headers={"Content-Type": self.content_type})
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+                if response.will_close:
+                    connection.close()
+                    connection = self._connect()
+            except (OSError, http.client.HTTPException) as e:
+                error = type(e).__name__
+                connection.close()
+                connection = self._connect()
+            finished_at = time.perf_counter()
+
+            with lock:
+                results.append((scheduled_at, finished_at, status, error))
+        connection.close()
+
+    def run_step(self, rate: float, duration: float) -> dict:
+        """
+        Exécute un palier à débit constant.
+
+        Args:
+            rate (float): Débit offert, en requêtes par seconde.
+            duration (float): Durée d'envoi, en secondes.
+
+        Returns:
+            dict: Débit obtenu, percentiles de latence (ms) des requêtes réussies et des échecs, taux d'erreur du palier.
+        """
+        # Les corps sont générés à l'avance pour ne pas mesurer le générateur
+        n_requests = max(1, int(rate * duration))
+        bodies = [self._body() for _ in range(n_requests)]
+
+        jobs = queue.Queue()
+        results, lock, stop = [], threading.Lock(), threading.Event()
+        workers = [
+            threading.Thread(target=self._worker, args=(jobs, results, lock, stop), daemon=True)
+            for _ in range(self.concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # Planification en boucle ouverte : les instants d'envoi ne dépendent pas des réponses
+        start = time.perf_counter() + 0.05
+        offset = 0.0
+        for body in bodies:
+            jobs.put((start + offset, body))
+            offset += self._interval(rate)
+        for _ in workers:
+            jobs.put(None)
+
+        deadline = start + offset + self.drain_timeout
+        for worker in workers:
+            worker.join(timeout=max(0.0, deadline - time.perf_counter()))
+
+        # Après l'échéance, plus aucun envoi : les requêtes restantes sont comptées comme
+        # non terminées et les requêtes en cours s'achèvent avant le palier suivant
+        stop.set()
+        for worker in workers:
+            worker.join(timeout=self.timeout)
+
+        with lock:
+            completed = list(results)
+
+        ok = [r[2] is not None and 200 <= r[2] < 400 for r in completed]
+        successes = [r for r, is_ok in zip(completed, ok) if is_ok]
+        failures = [r for r, is_ok in zip(completed, ok) if not is_ok]
+        errors = Counter(r[3] or f"HTTP {r[2]}" for r in failures)
+        unfinished = n_requests - len(completed)
+        if unfinished:
+            errors["unfinished"] = unfinished
+
+        elapsed = (max(r[1] for r in completed) - start) if completed else duration
+        n_errors = n_requests - len(successes)
+        return {
+            "offered_rate": rate,
+            "requests": n_requests,
+            "records_per_request": self.batch_size if self.mode == "json" else 1,
+            "throughput": len(successes) / elapsed if elapsed > 0 else 0.0,
+            "error_rate": n_errors / n_requests,
+            "errors": dict(errors),
+            # Seules les réponses réussies comptent : un serveur saturé qui rejette vite (503)
+            # ne doit pas paraître plus rapide qu'un serveur qui répond
+            "latency_ms": latency_summary(successes),
+            "error_latency_ms": latency_summary(failures),
+        }
+
+    def _interval(self, rate: float) -> float:
+        """Intervalle jusqu'au prochain envoi (exponentiel pour des arrivées de Poisson)."""
+        if self.arrivals == "poisson":
+            return self.generator.random.expovariate(rate)
+        return 1.0 / rate
+
+
+def start_server(command: str, url: str, startup_timeout: float):
+    """
+    Démarre le serveur depuis la racine du projet et attend qu'il réponde sur `url`.
+
+    Returns:
+        subprocess.Popen: Le processus du serveur.
+
+    Raises:
+        RuntimeError: Si le serveur ne répond pas avant `startup_timeout` secondes.
+    """
+    process = subprocess.Popen(shlex.split(command), cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    parsed = urllib.parse.urlparse(url)
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Le serveur s'est arrêté au démarrage (code {process.returncode}) : {command}")
+        try:
+            connection = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=1)
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            connection.close()
+            return process
+        except (OSError, http.client.HTTPException):
+            time.sleep(0.2)
+    stop_server(process)
+    raise RuntimeError(f"Le serveur n'a pas répondu sur {url} après {startup_timeout} s : {command}")
+
+
+def stop_server(process) -> None:
+    """Arrête le serveur démarré par `start_server`."""
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def print_step(label: str, step: dict) -> None:
+    latency = step["latency_ms"]
+    print(
+        f"{label:<16} offert={step['offered_rate']:>8.1f} req/s  obtenu={step['throughput']:>8.1f} req/s  "
+        f"p50={latency['p50']:>8.1f} ms  p95={latency['p95']:>8.1f} ms  p99={latency['p99']:>8.1f} ms  "
+        f"erreurs={step['error_rate']:>6.1%}"
+    )
+
+
+def compare(paths) -> None:
+    """Affiche côte à côte les courbes de saturation de plusieurs fichiers JSON."""
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+        for step in report["steps"]:
+            print_step(report["label"], step)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge HTTP des points d'accès de prédiction")
+    parser.add_argument('--url', default="http://127.0.0.1:5000", help="URL de base du serveur")
+    parser.add_argument('--command', default=f"{sys.executable} app.py",
+                        help="Commande de démarrage du serveur (ignorée avec --no-start)")
+    parser.add_argument('--no-start', action='store_true', help="Cibler un serveur déjà démarré")
+    parser.add_argument('--endpoint', default="/predict", help="Chemin du point d'accès")
+    parser.add_argument('--mode', choices=["form", "json"], default="form",
+                        help="Format du corps : formulaire (/predict) ou liste JSON (point d'accès par lots)")
+    parser.add_argument('--batch-size', type=int, default=1, help="Enregistrements par requête en mode json")
+    parser.add_argument('--rates', default="5,10,20,50", help="Débits offerts (req/s), séparés par des virgules")
+    parser.add_argument('--duration', type=float, default=10.0, help="Durée de chaque palier (s)")
+    parser.add_argument('--concurrency', type=int, default=16, help="Nombre maximal de requêtes simultanées")
+    parser.add_argument('--arrivals', choices=["poisson", "constant"], default="poisson", help="Loi des arrivées")
+    parser.add_argument('--timeout', type=float, default=30.0, help="Délai maximal d'une requête (s)")
+    parser.add_argument('--startup-timeout', type=float, default=60.0, help="Délai de démarrage du serveur (s)")
+    parser.add_argument('--seed', type=int, default=None, help="Graine du générateur de requêtes")
+    parser.add_argument('--label', default=None, help="Nom de la configuration testée")
+    parser.add_argument('--output', default=None, help="Fichier JSON de la courbe de saturation")
+    parser.add_argument('--compare', nargs='+', metavar='JSON', help="Comparer des résultats existants et quitter")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    label = args.label or ("external" if args.no_start else os.path.basename(shlex.split(args.command)[-1]))
+    generator = PayloadGenerator(seed=args.seed)
+    tester = LoadTester(args.url, args.endpoint, generator, mode=args.mode, batch_size=args.batch_size,
+                        concurrency=args.concurrency, arrivals=args.arrivals, timeout=args.timeout)
+
+    process = None if args.no_start else start_server(args.command, args.url, args.startup_timeout)
+    steps = []
+    try:
+        for rate in (float(r) for r in args.rates.split(',')):
+            step = tester.run_step(rate, args.duration)
+            print_step(label, step)
+            steps.append(step)
+    finally:
+        if process is not None:
+            stop_server(process)
+
+    if args.output:
+        report = {
+            "label": label,
+            "url": args.url,
+            "endpoint": args.endpoint,
+            "command": None if args.no_start else args.command,
+            "mode": args.mode,
+            "concurrency": args.concurrency,
+            "arrivals": args.arrivals,
+            "duration": args.duration,
+            "steps": steps,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
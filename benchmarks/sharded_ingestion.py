@@ -0,0 +1,72 @@
+"""
+Mesure le passage à l'échelle de l'ingestion parallèle de fichiers sources multiples.
+
+Génère des fichiers synthétiques (par ré-échantillonnage de `stud.csv`), puis mesure
+`DataIngestion.load_sources` en mode par défaut et compact pour plusieurs nombres de
+processus, avec le débit (lignes/s) et l'accélération par rapport à un seul processus.
+
+Usage :
+    python -m benchmarks.sharded_ingestion --shards 64 --rows-per-shard 50000 --workers 1,2,4,8
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.components.data_ingestion import DataIngestion, DataIngestionConfig
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'notebook', 'data', 'stud.csv')
+
+
+def make_shards(n_shards: int, rows_per_shard: int, out_dir: str):
+    """Écrit `n_shards` fichiers CSV de `rows_per_shard` lignes et retourne leur motif glob."""
+    df = pd.read_csv(SOURCE_PATH)
+    for i in range(n_shards):
+        shard = df.sample(n=rows_per_shard, replace=True, random_state=i)
+        shard.to_csv(os.path.join(out_dir, f'day_{i:04d}.csv'), index=False)
+    return os.path.join(out_dir, 'day_*.csv')
+
+
+def run(pattern: str, compact: bool, workers: int) -> dict:
+    """Lit tous les fichiers avec `workers` processus et retourne les mesures."""
+    config = DataIngestionConfig(source=pattern, max_workers=workers, compact=compact)
+    start_time = time.perf_counter()
+    df = DataIngestion(config).load_sources()
+    elapsed = time.perf_counter() - start_time
+    return {'compact': compact, 'workers': workers, 'rows': len(df), 'seconds': elapsed, 'rows_per_s': len(df) / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'ingestion parallèle")
+    parser.add_argument('--shards', type=int, default=64, help="Nombre de fichiers sources")
+    parser.add_argument('--rows-per-shard', type=int, default=50_000, help="Lignes par fichier")
+    parser.add_argument('--workers', default="1,2,4,8", help="Nombres de processus, séparés par des virgules")
+    parser.add_argument('--output', default=None, help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as out_dir:
+        pattern = make_shards(args.shards, args.rows_per_shard, out_dir)
+        for compact in (False, True):
+            baseline = None
+            for workers in (int(w) for w in args.workers.split(',')):
+                r = run(pattern, compact, workers)
+                baseline = baseline or r['rows_per_s']
+                r['speedup'] = r['rows_per_s'] / baseline
+                results.append(r)
+                print(
+                    f"compact={r['compact']!s:<5} workers={r['workers']:<3} rows={r['rows']} "
+                    f"{r['seconds']:.2f} s {r['rows_per_s']:.0f} l/s x{r['speedup']:.2f}"
+                )
+
+    print(f"cœurs disponibles : {os.cpu_count()}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'cpu_count': os.cpu_count(), 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+# 📌 Configuration chargée automatiquement par gunicorn depuis la racine du projet
+
+
+def worker_exit(server, worker):
+    """
+    Vide le journal des prédictions à l'arrêt d'un worker.
+
+    Les workers gunicorn se terminent sans exécuter les fonctions `atexit` :
+    sans ce hook, les enregistrements encore dans le tampon seraient perdus.
+    """
+    from app import prediction_logger
+
+    prediction_logger.close()
@@ -0,0 +1,48 @@
+"""
+Noms des colonnes et modalités connues du jeu de données des étudiants.
+
+Module sans dépendance (pas de pandas) pour pouvoir être importé par les outils
+qui n'utilisent que la bibliothèque standard ; `src.schema` le réexporte.
+"""
+
+TARGET_COLUMN = "math_score"
+
+NUMERICAL_COLUMNS = ["writing_score", "reading_score"]
+
+# Modalités connues de chaque variable catégorique (ordre stable = code entier)
+CATEGORY_LEVELS = {
+    "gender": ["female", "male"],
+    "race_ethnicity": ["group A", "group B", "group C", "group D", "group E"],
+    "parental_level_of_education": [
+        "associate's degree",
+        "bachelor's degree",
+        "high school",
+        "master's degree",
+        "some college",
+        "some high school",
+    ],
+    "lunch": ["free/reduced", "standard"],
+    "test_preparation_course": ["completed", "none"],
+}
+
+CATEGORICAL_COLUMNS = list(CATEGORY_LEVELS)
+
+# Colonnes attendues dans un fichier source, dans l'ordre de `stud.csv`
+DATASET_COLUMNS = CATEGORICAL_COLUMNS + [TARGET_COLUMN, "reading_score", "writing_score"]
+
+
+def encode_category(column: str, value) -> int:
+    """
+    Retourne le code entier d'une modalité catégorique.
+
+    Args:
+        column (str): Nom de la colonne catégorique.
+        value: Valeur à encoder.
+
+    Returns:
+        int: Position de la modalité dans `CATEGORY_LEVELS[column]`, ou -1 si elle est inconnue.
+    """
+    try:
+        return CATEGORY_LEVELS[column].index(value)
+    except ValueError:
+        return -1
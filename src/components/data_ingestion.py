@@ -1,35 +1,133 @@
+import glob
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Union
+
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from dataclasses import dataclass
 from src.exception import MyException
 from src.logger import logging
+from src.schema import (
+    CATEGORICAL_COLUMNS,
+    DATASET_COLUMNS,
+    NUMERICAL_COLUMNS,
+    TARGET_COLUMN,
+    get_compact_dtypes,
+    read_dataset,
+    validate_categories,
+)
 from src.components.data_transformation import DataTransformation
 from src.components.data_transformation import DataTransformationConfig
 from src.components.model_trainer import ModelTrainer
 from src.components.model_trainer import ModelTrainerConfig
 
+# Racine du projet, pour que la source par défaut ne dépende pas du dossier courant
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
 @dataclass
 class DataIngestionConfig:
     """
     Configuration pour l'ingestion des données.
-    Définit les chemins des fichiers de sortie pour les jeux de données.
+    Définit les fichiers sources et les chemins des fichiers de sortie pour les jeux de données.
+
+    `source` accepte un chemin, un motif glob (ex: 'exports/*.csv') ou une liste des deux ;
+    plusieurs fichiers sont lus en parallèle par `max_workers` processus (par défaut : un par cœur).
+    En mode compact, la source est lue avec le schéma explicite de `src.schema`.
     """
+    source: Union[str, List[str]] = os.path.join(ROOT_DIR, 'notebook', 'data', 'stud.csv')
+    max_workers: int = None
     train_data_path: str = os.path.join('artifacts', 'train.csv')
     test_data_path: str = os.path.join('artifacts', 'test.csv')
     raw_data_path: str = os.path.join('artifacts', 'raw.csv')
+    compact: bool = False
+
+def resolve_sources(source: Union[str, List[str]]) -> List[str]:
+    """
+    Développe les motifs glob de la configuration en une liste de fichiers.
+
+    Args:
+        source (Union[str, List[str]]): Chemin, motif glob ou liste de chemins/motifs.
+
+    Returns:
+        List[str]: Fichiers trouvés, triés pour chaque motif et sans doublons.
+
+    Raises:
+        FileNotFoundError: Si un motif ne correspond à aucun fichier.
+    """
+    patterns = [source] if isinstance(source, str) else list(source)
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            raise FileNotFoundError(f"Aucun fichier ne correspond à la source '{pattern}'.")
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+
+def read_shard(path: str, compact: bool = False):
+    """
+    Lit un fichier source et vérifie qu'il respecte le schéma du jeu de données.
+
+    Fonction de niveau module pour pouvoir être exécutée dans un `ProcessPoolExecutor`.
+
+    Args:
+        path (str): Chemin du fichier CSV.
+        compact (bool): Utiliser le schéma compact.
+
+    Returns:
+        Tuple[pd.DataFrame, float]: Les données (colonnes dans l'ordre de `DATASET_COLUMNS`, variables
+            catégoriques en `category`) et la durée de lecture en secondes.
+
+    Raises:
+        ValueError: Si des colonnes manquent ou sont en trop, si un score n'est pas numérique
+            ou si une variable catégorique contient une modalité absente de `CATEGORY_LEVELS`.
+    """
+    start_time = time.perf_counter()
+    dtypes = get_compact_dtypes()
+    if compact:
+        df = read_dataset(path, compact=True)
+    else:
+        # Les variables catégoriques sont analysées directement en `category` (valeurs d'origine
+        # conservées), ce qui est moins coûteux que des chaînes `object`
+        df = read_dataset(path, dtype={column: "category" for column in CATEGORICAL_COLUMNS})
+
+    missing = [column for column in DATASET_COLUMNS if column not in df.columns]
+    extra = [column for column in df.columns if column not in DATASET_COLUMNS]
+    if missing or extra:
+        raise ValueError(f"Schéma invalide pour {path} : colonnes manquantes {missing}, colonnes inattendues {extra}")
+
+    not_numeric = [
+        column for column in NUMERICAL_COLUMNS + [TARGET_COLUMN]
+        if not pd.api.types.is_numeric_dtype(df[column])
+    ]
+    if not_numeric:
+        raise ValueError(f"Schéma invalide pour {path} : colonnes non numériques {not_numeric}")
+
+    # En mode compact, `read_dataset` a déjà rejeté les modalités inconnues avant la conversion
+    if not compact:
+        validate_categories(df, path)
+        # Les modalités étant connues, fixer les modalités est sans perte : le bloc renvoyé au
+        # processus parent est bien plus petit à sérialiser que des chaînes `object`, et les
+        # blocs partagent les mêmes modalités, donc `pd.concat` conserve le type `category`
+        df = df.astype({column: dtypes[column] for column in CATEGORICAL_COLUMNS})
+
+    return df[DATASET_COLUMNS], time.perf_counter() - start_time
+
 
 class DataIngestion:
     """
     Classe responsable de l'ingestion des données :
-    - Chargement des données depuis un fichier CSV
+    - Chargement et validation des données depuis un ou plusieurs fichiers CSV (en parallèle)
     - Sauvegarde des données brutes
     - Division en train/test et sauvegarde
     """
 
-    def __init__(self):
-        self.config = DataIngestionConfig()
+    def __init__(self, config: DataIngestionConfig = None):
+        self.config = config or DataIngestionConfig()
 
     def initiate_data_ingestion(self):
         """
@@ -42,8 +140,9 @@ class DataIngestion:
 
         try:
             # Charger les données
-            df = pd.read_csv('../../notebook/data/stud.csv')
+            df = self.load_sources()
             logging.info(f'Données chargées avec succès. Nombre d\'échantillons : {df.shape[0]}, Nombre de colonnes : {df.shape[1]}')
+            logging.info(f'Mémoire occupée (compact={self.config.compact}) : {df.memory_usage(deep=True).sum() / 1e6:.2f} Mo')
 
             # Création du dossier 'artifacts' si inexistant
             os.makedirs(os.path.dirname(self.config.raw_data_path), exist_ok=True)
@@ -69,6 +168,42 @@ class DataIngestion:
             logging.error(f"Erreur lors de l'ingestion des données : {str(e)}")
             raise MyException(e,sys)
 
+    def load_sources(self) -> pd.DataFrame:
+        """
+        Lit et valide tous les fichiers sources, en parallèle s'il y en a plusieurs.
+
+        Les fichiers sont concaténés dans l'ordre de `resolve_sources`, quel que soit
+        l'ordre de fin des lectures, afin que la division train/test reste reproductible.
+
+        Returns:
+            pd.DataFrame: Les données combinées.
+        """
+        paths = resolve_sources(self.config.source)
+        max_workers = min(self.config.max_workers or os.cpu_count() or 1, len(paths))
+        logging.info(f'{len(paths)} fichier(s) source(s) à lire avec {max_workers} processus')
+
+        start_time = time.perf_counter()
+        compact = [self.config.compact] * len(paths)
+        if max_workers == 1:
+            shards = map(read_shard, paths, compact)
+            frames = self._log_shards(paths, shards)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                shards = executor.map(read_shard, paths, compact)
+                frames = self._log_shards(paths, shards)
+
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        elapsed = time.perf_counter() - start_time
+        logging.info(f'{len(df)} lignes lues depuis {len(paths)} fichier(s) en {elapsed:.3f} s ({len(df) / max(elapsed, 1e-9):.0f} lignes/s)')
+        return df
+
+    def _log_shards(self, paths: List[str], shards) -> List[pd.DataFrame]:
+        frames = []
+        for path, (frame, elapsed) in zip(paths, shards):
+            logging.info(f'Fichier {path} : {len(frame)} lignes lues en {elapsed:.3f} s')
+            frames.append(frame)
+        return frames
+
 if __name__ == '__main__':
     obj = DataIngestion()
     train,test,raw = obj.initiate_data_ingestion()
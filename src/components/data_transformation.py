@@ -1,7 +1,7 @@
 import os
 import sys
+import time
 import numpy as np
-import pandas as pd
 from dataclasses import dataclass
 
 from pandas.io.xml import preprocess_data
@@ -11,6 +11,7 @@ from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
 from src.logger import logging
 from src.exception import MyException
+from src.schema import CATEGORICAL_COLUMNS, NUMERICAL_COLUMNS, TARGET_COLUMN, read_dataset
 from src.utils import save_object
 
 
@@ -19,8 +20,12 @@ class DataTransformationConfig:
     """
     Configuration pour la transformation des données.
     Définit le chemin où l'objet de prétraitement sera sauvegardé.
+
+    En mode compact, les CSV sont lus avec le schéma explicite de `src.schema`
+    (type `category` et entiers 8 bits) et les matrices produites sont en float32.
     """
     preprocessor_obj_file_path: str = os.path.join('artifacts', 'preprocessor.pkl')
+    compact: bool = False
 
 class DataTransformation:
     """
@@ -29,8 +34,8 @@ class DataTransformation:
     - Gère l'encodage et l'imputation des colonnes catégoriques.
     """
 
-    def __init__(self):
-        self.config = DataTransformationConfig()
+    def __init__(self, config: DataTransformationConfig = None):
+        self.config = config or DataTransformationConfig()
 
     def get_data_transform_obj(self):
         """
@@ -46,14 +51,8 @@ class DataTransformation:
             logging.info("Début de la construction du pipeline de transformation des données.")
 
             # Définition des colonnes numériques et catégoriques
-            numerical_columns = ["writing_score", "reading_score"]
-            categorical_columns = [
-                "gender",
-                "race_ethnicity",
-                "parental_level_of_education",
-                "lunch",
-                "test_preparation_course",
-            ]
+            numerical_columns = NUMERICAL_COLUMNS
+            categorical_columns = CATEGORICAL_COLUMNS
 
             # Pipeline pour les variables numériques
             num_pipeline = Pipeline([
@@ -65,7 +64,7 @@ class DataTransformation:
             # Pipeline pour les variables catégoriques
             categorical_pipeline = Pipeline([
                 ("imputer", SimpleImputer(strategy="most_frequent")),  # Remplace les valeurs manquantes par la valeur la plus fréquente
-                ("encoder", OneHotEncoder(handle_unknown="ignore")),  # Encodage One-Hot avec gestion des valeurs inconnues
+                ("encoder", OneHotEncoder(handle_unknown="ignore", dtype=np.float32 if self.config.compact else np.float64)),  # Encodage One-Hot avec gestion des valeurs inconnues
                 ("scaler", StandardScaler(with_mean=False)),  # Standardisation (évite l'erreur sur les matrices clairsemées)
             ])
             logging.info("Pipeline catégoriel créé avec imputation, encodage One-Hot et standardisation.")
@@ -107,38 +106,48 @@ class DataTransformation:
             if not os.path.exists(test_path):
                 raise FileNotFoundError(f"Le fichier de test {test_path} est introuvable.")
 
+            # Schéma explicite en mode compact, types par défaut de pandas sinon
             logging.info(f"Chargement des données d'entraînement depuis {train_path}")
-            train_df = pd.read_csv(train_path)
+            train_df = read_dataset(train_path, compact=self.config.compact)
             logging.info(f"Chargement des données de test depuis {test_path}")
-            test_df = pd.read_csv(test_path)
+            test_df = read_dataset(test_path, compact=self.config.compact)
 
             logging.info("Lecture des fichiers CSV réussie.")
+            logging.info(
+                f"Mémoire occupée (compact={self.config.compact}) : "
+                f"train {train_df.memory_usage(deep=True).sum() / 1e6:.2f} Mo, "
+                f"test {test_df.memory_usage(deep=True).sum() / 1e6:.2f} Mo"
+            )
             logging.info("Obtention de l'objet de prétraitement...")
 
             preprocess_obj = self.get_data_transform_obj()
             logging.info("Objet de prétraitement obtenu avec succès.")
 
             # Définition des colonnes
-            target_column_name = "math_score"
-            numerical_columns = ["writing_score", "reading_score"]
+            target_column_name = TARGET_COLUMN
 
             # Séparation des features et de la variable cible
             logging.info("Séparation des features et de la variable cible.")
-            input_feature_train_df = train_df.drop(columns=[target_column_name], axis=1)
+            input_feature_train_df = train_df.drop(columns=[target_column_name])
             target_feature_train_df = train_df[target_column_name]
 
-            input_feature_test_df = test_df.drop(columns=[target_column_name], axis=1)
+            input_feature_test_df = test_df.drop(columns=[target_column_name])
             target_feature_test_df = test_df[target_column_name]
 
             # Transformation des données
             logging.info("Application de la transformation aux données d'entraînement et de test.")
+            start_time = time.perf_counter()
             input_feature_train_arr = preprocess_obj.fit_transform(input_feature_train_df)
             input_feature_test_arr = preprocess_obj.transform(input_feature_test_df)
+            elapsed = time.perf_counter() - start_time
+            n_rows = len(input_feature_train_df) + len(input_feature_test_df)
+            logging.info(f"Transformation de {n_rows} lignes en {elapsed:.3f} s ({n_rows / max(elapsed, 1e-9):.0f} lignes/s)")
 
             # Concaténation des features transformés avec la variable cible
             logging.info("Concaténation des données transformées avec la variable cible.")
-            train_arr = np.c_[input_feature_train_arr, np.array(target_feature_train_df)]
-            test_arr = np.c_[input_feature_test_arr, np.array(target_feature_test_df)]
+            train_arr = self._concat_target(input_feature_train_arr, target_feature_train_df)
+            test_arr = self._concat_target(input_feature_test_arr, target_feature_test_df)
+            logging.info(f"Matrices produites en {train_arr.dtype} : train {train_arr.nbytes / 1e6:.2f} Mo, test {test_arr.nbytes / 1e6:.2f} Mo")
 
             # Sauvegarde de l'objet de prétraitement
             logging.info(f"Sauvegarde de l'objet de prétraitement dans {self.config.preprocessor_obj_file_path}.")
@@ -151,3 +160,28 @@ class DataTransformation:
         except Exception as e:
             logging.error(f"Erreur lors de la transformation des données : {e}")
             raise MyException(e, sys)
+
+    def _concat_target(self, features, target):
+        """
+        Concatène les features transformés avec la variable cible.
+
+        En mode compact, le résultat est écrit directement dans une matrice float32
+        pré-allouée, sans passer par la copie intermédiaire en float64 de `np.c_`.
+
+        Args:
+            features (numpy.ndarray ou scipy.sparse matrix): Features transformés.
+            target (pd.Series): Variable cible.
+
+        Returns:
+            numpy.ndarray: Matrice dont la dernière colonne est la variable cible.
+        """
+        if hasattr(features, "toarray"):
+            features = features.toarray()
+
+        if not self.config.compact:
+            return np.c_[features, np.array(target)]
+
+        arr = np.empty((features.shape[0], features.shape[1] + 1), dtype=np.float32)
+        arr[:, :-1] = features
+        arr[:, -1] = target.to_numpy(dtype=np.float32, na_value=np.nan)
+        return arr
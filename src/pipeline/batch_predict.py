@@ -0,0 +1,206 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+from src.exception import MyException
+from src.logger import logging
+from src.schema import read_dataset
+from src.utils import load_object
+
+# 📌 Modèle et préprocesseur chargés une seule fois par processus worker
+_model = None
+_preprocessor = None
+
+
+def _init_worker(model_path: str, preprocessor_path: str) -> None:
+    """Charge le modèle et le préprocesseur dans le processus courant."""
+    global _model, _preprocessor
+    _model = load_object(file_path=model_path)
+    _preprocessor = load_object(file_path=preprocessor_path)
+
+
+def _score_chunk(chunk: pd.DataFrame):
+    """
+    Transforme et prédit un bloc de données avec le modèle du processus courant.
+
+    Returns:
+        Tuple[np.ndarray, float, int]: Prédictions, durée en secondes et pid du worker.
+    """
+    start_time = time.perf_counter()
+    pred = _model.predict(_preprocessor.transform(chunk))
+    return pred, time.perf_counter() - start_time, os.getpid()
+
+
+@dataclass
+class BatchPredictConfig:
+    """
+    Configuration du scoring hors ligne par lots.
+
+    Attributes:
+        input_path (str): Fichier CSV à scorer.
+        output_path (str): Fichier CSV où écrire les prédictions.
+        model_path (str): Chemin du modèle entraîné.
+        preprocessor_path (str): Chemin de l'objet de prétraitement.
+        chunksize (int): Nombre de lignes par bloc.
+        workers (int): Nombre de processus de scoring (par défaut : un par cœur).
+        max_in_flight (int): Nombre maximal de blocs en mémoire à la fois (par défaut : 2 par worker).
+        keep_columns (bool): Recopier les colonnes d'entrée à côté de la prédiction.
+        compact (bool): Lire les blocs avec le schéma compact de `src.schema`.
+    """
+    input_path: str
+    output_path: str
+    model_path: str = os.path.join('src', 'components', 'artifacts', 'model.pkl')
+    preprocessor_path: str = os.path.join('src', 'components', 'artifacts', 'preprocessor.pkl')
+    chunksize: int = 100_000
+    workers: int = None
+    max_in_flight: int = None
+    keep_columns: bool = False
+    compact: bool = False
+
+
+class BatchPredictPipeline:
+    """
+    Score un gros fichier CSV par blocs avec un pool de processus.
+
+    Les blocs sont lus au fil de l'eau, envoyés aux workers (qui chargent le modèle une
+    seule fois) et leurs prédictions sont écrites dans l'ordre d'origine dès que possible.
+    Le nombre de blocs en cours est borné, ce qui borne aussi la mémoire utilisée.
+
+    Methods:
+        run(): Exécute le scoring et retourne un résumé des performances.
+    """
+
+    def __init__(self, config: BatchPredictConfig):
+        self.config = config
+
+    def run(self) -> dict:
+        """
+        Exécute le scoring du fichier d'entrée.
+
+        Returns:
+            dict: Nombre de lignes et de blocs, durée totale et débit en lignes/s.
+
+        Raises:
+            MyException: En cas d'erreur de lecture, de prédiction ou d'écriture.
+        """
+        try:
+            workers = self.config.workers or os.cpu_count() or 1
+            max_in_flight = self.config.max_in_flight or 2 * workers
+            logging.info(
+                f"Scoring de {self.config.input_path} vers {self.config.output_path} "
+                f"(blocs de {self.config.chunksize} lignes, {workers} worker(s))"
+            )
+
+            output_dir = os.path.dirname(self.config.output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+            start_time = time.perf_counter()
+            chunks = read_dataset(self.config.input_path, compact=self.config.compact, chunksize=self.config.chunksize)
+            self._n_rows, self._n_chunks = 0, 0
+            self._columns = []
+
+            with open(self.config.output_path, "w", newline="", encoding="utf-8") as output:
+                if workers == 1:
+                    _init_worker(self.config.model_path, self.config.preprocessor_path)
+                    for chunk in self._non_empty(chunks):
+                        self._write(output, self._kept(chunk), *_score_chunk(chunk))
+                else:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_worker,
+                        initargs=(self.config.model_path, self.config.preprocessor_path),
+                    ) as executor:
+                        pending = deque()
+                        for chunk in self._non_empty(chunks):
+                            # Attendre le bloc le plus ancien avant d'en lire un nouveau
+                            if len(pending) >= max_in_flight:
+                                self._write(output, *self._result(pending.popleft()))
+                            pending.append((self._kept(chunk), executor.submit(_score_chunk, chunk)))
+                        while pending:
+                            self._write(output, *self._result(pending.popleft()))
+
+                # Entrée sans ligne : la sortie garde son en-tête
+                if self._n_chunks == 0:
+                    columns = self._columns if self.config.keep_columns else []
+                    pd.DataFrame(columns=columns + ["prediction"]).to_csv(output, index=False)
+
+            elapsed = time.perf_counter() - start_time
+            summary = {
+                "rows": self._n_rows,
+                "chunks": self._n_chunks,
+                "seconds": elapsed,
+                "rows_per_second": self._n_rows / elapsed if elapsed > 0 else 0.0,
+            }
+            logging.info(
+                f"Scoring terminé : {self._n_rows} lignes, {self._n_chunks} blocs en {elapsed:.2f} s "
+                f"({summary['rows_per_second']:.0f} lignes/s)"
+            )
+            return summary
+
+        except Exception as e:
+            logging.error(f"Erreur lors du scoring par lots : {e}")
+            raise MyException(e, sys)
+
+    def _non_empty(self, chunks):
+        # Un CSV réduit à son en-tête produit un bloc vide, que le préprocesseur refuse
+        for chunk in chunks:
+            self._columns = list(chunk.columns)
+            if len(chunk):
+                yield chunk
+
+    def _kept(self, chunk: pd.DataFrame):
+        # Le parent ne garde le bloc que s'il doit le recopier ; sinon seul son nombre de lignes est utile
+        return chunk if self.config.keep_columns else len(chunk)
+
+    @staticmethod
+    def _result(item):
+        kept, future = item
+        return (kept, *future.result())
+
+    def _write(self, output, kept, pred, elapsed: float, pid: int) -> None:
+        if self.config.keep_columns:
+            result = kept.assign(prediction=pred)
+            n_rows = len(kept)
+        else:
+            result = pd.DataFrame({"prediction": pred})
+            n_rows = kept
+        result.to_csv(output, index=False, header=self._n_chunks == 0)
+
+        logging.info(
+            f"Bloc {self._n_chunks} : {n_rows} lignes prédites en {elapsed:.3f} s "
+            f"({n_rows / max(elapsed, 1e-9):.0f} lignes/s, worker {pid})"
+        )
+        self._n_rows += n_rows
+        self._n_chunks += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scoring hors ligne d'un fichier CSV par lots")
+    parser.add_argument("input_path", help="Fichier CSV à scorer")
+    parser.add_argument("output_path", help="Fichier CSV de sortie")
+    parser.add_argument("--model", dest="model_path", default=BatchPredictConfig.model_path, help="Chemin du modèle")
+    parser.add_argument("--preprocessor", dest="preprocessor_path", default=BatchPredictConfig.preprocessor_path,
+                        help="Chemin du préprocesseur")
+    parser.add_argument("--chunksize", type=int, default=BatchPredictConfig.chunksize, help="Lignes par bloc")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus de scoring")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="Nombre maximal de blocs en cours")
+    parser.add_argument("--keep-columns", action="store_true", help="Recopier les colonnes d'entrée dans la sortie")
+    parser.add_argument("--compact", action="store_true", help="Lire les blocs avec le schéma compact")
+    args = parser.parse_args()
+
+    summary = BatchPredictPipeline(BatchPredictConfig(**vars(args))).run()
+    print(
+        f"{summary['rows']} lignes en {summary['chunks']} blocs, {summary['seconds']:.2f} s "
+        f"({summary['rows_per_second']:.0f} lignes/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
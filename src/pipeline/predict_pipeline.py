@@ -2,6 +2,7 @@ import sys
 import os
 import pandas as pd
 from src.exception import MyException
+from src.pipeline.prediction_log import model_version_from_file
 from src.utils import load_object
 
 
@@ -9,12 +10,15 @@ class PredictPipeline:
     """
     Classe responsable de la prédiction à l'aide du modèle entraîné.
 
+    Attributes:
+        model_version (str): Version du modèle utilisé lors du dernier appel à `predict`.
+
     Methods:
         predict(features): Charge le modèle et le préprocesseur, applique la transformation et effectue une prédiction.
     """
 
     def __init__(self):
-        pass
+        self.model_version = None
 
     def predict(self, features):
         """
@@ -37,6 +41,7 @@ class PredictPipeline:
 
             # Chargement du modèle et du préprocesseur
             model = load_object(file_path=model_path)
+            self.model_version = model_version_from_file(model_path)
             preprocessor = load_object(file_path=preprocessor_path)
 
 
@@ -0,0 +1,294 @@
+import glob
+import hashlib
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+from src.exception import MyException
+from src.logger import logging
+from src.schema import CATEGORICAL_COLUMNS, NUMERICAL_COLUMNS, encode_category
+
+# 📌 Format binaire d'un enregistrement (largeur fixe, sans alignement)
+# - timestamp : horodatage Unix de la prédiction
+# - categories : codes entiers des variables catégoriques (-1 = modalité inconnue)
+# - scores : scores numériques dans l'ordre de `NUMERICAL_COLUMNS`
+# - prediction : score de mathématiques prédit
+# - model_version : empreinte du modèle ayant produit la prédiction
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("categories", "i1", (len(CATEGORICAL_COLUMNS),)),
+    ("scores", "<f4", (len(NUMERICAL_COLUMNS),)),
+    ("prediction", "<f4"),
+    ("model_version", "S16"),
+])
+
+SEGMENT_PATTERN = "segment_*.bin"
+
+# Versions déjà calculées, indexées par (chemin, date de modification, taille)
+_model_versions = {}
+
+
+@dataclass
+class PredictionLogConfig:
+    """
+    Configuration du journal binaire des prédictions.
+
+    Attributes:
+        log_dir (str): Dossier où sont écrits les segments.
+        buffer_size (int): Nombre d'enregistrements que peut contenir le tampon circulaire.
+        flush_interval (float): Délai maximal (en secondes) entre deux vidages du tampon.
+        segment_max_bytes (int): Taille à partir de laquelle un nouveau segment est ouvert.
+    """
+    log_dir: str = os.path.join('artifacts', 'prediction_logs')
+    buffer_size: int = 65536
+    flush_interval: float = 1.0
+    segment_max_bytes: int = 64 * 1024 * 1024
+
+
+def model_version_from_file(file_path: str) -> str:
+    """
+    Calcule une empreinte courte du fichier modèle, utilisée comme version.
+
+    Le résultat est mis en cache tant que la date de modification et la taille du
+    fichier ne changent pas : l'appel peut donc être fait à chaque chargement du modèle.
+
+    Args:
+        file_path (str): Chemin du modèle sérialisé.
+
+    Returns:
+        str: Les 16 premiers caractères hexadécimaux du SHA-256 du fichier, ou "unknown" s'il est introuvable.
+    """
+    try:
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        if key not in _model_versions:
+            digest = hashlib.sha256()
+            with open(file_path, "rb") as file_obj:
+                for block in iter(lambda: file_obj.read(1024 * 1024), b""):
+                    digest.update(block)
+            _model_versions[key] = digest.hexdigest()[:16]
+        return _model_versions[key]
+    except OSError:
+        logging.warning(f"Modèle introuvable pour le calcul de version : {file_path}")
+        return "unknown"
+
+
+class PredictionLogger:
+    """
+    Journal d'audit des prédictions en ajout seul.
+
+    Les enregistrements sont écrits dans un tampon circulaire en mémoire ; un thread
+    en arrière-plan les vide par lots dans des segments binaires dont la taille est bornée.
+    Si le disque ne suit pas et que le tampon est plein, les nouveaux enregistrements
+    sont abandonnés (et comptés) plutôt que de bloquer la requête.
+
+    Le thread de vidage est démarré au premier `log()` de chaque processus : après un
+    `fork` (ex: gunicorn --preload), chaque worker repart d'un tampon vide avec son propre thread.
+
+    Methods:
+        start(): Démarre le thread de vidage.
+        log(data, prediction, model_version): Ajoute une prédiction au tampon.
+        flush(): Vide immédiatement le tampon sur disque.
+        close(): Arrête le thread et vide les enregistrements restants.
+    """
+
+    def __init__(self, config: PredictionLogConfig = None, model_version: str = "unknown"):
+        self.config = config or PredictionLogConfig()
+        self.model_version = model_version
+
+        self._buffer = np.zeros(self.config.buffer_size, dtype=RECORD_DTYPE)
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        # Après un fork, les verrous, le thread et le segment du parent ne sont plus utilisables
+        self._head = 0  # Nombre total d'enregistrements acceptés
+        self._tail = 0  # Nombre total d'enregistrements écrits sur disque
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+
+        self.dropped = 0
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._segment_file = None
+        self._segment_index = 0
+
+    @property
+    def written(self) -> int:
+        """Nombre d'enregistrements déjà écrits sur disque."""
+        return self._tail
+
+    def start(self) -> None:
+        """Démarre le thread de vidage en arrière-plan."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            os.makedirs(self.config.log_dir, exist_ok=True)
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="prediction-log-flusher", daemon=True)
+            self._thread.start()
+        logging.info(f"Journal des prédictions démarré dans {self.config.log_dir}")
+
+    def log(self, data, prediction: float, model_version: str = None) -> bool:
+        """
+        Ajoute une prédiction au tampon circulaire sans jamais attendre le disque.
+
+        Args:
+            data (MyData): Données d'entrée de la prédiction.
+            prediction (float): Score prédit.
+            model_version (str): Version du modèle ayant produit la prédiction (par défaut : celle du journal).
+
+        Returns:
+            bool: True si l'enregistrement a été accepté, False s'il a été abandonné.
+        """
+        if self._thread is None:
+            self.start()
+
+        timestamp = time.time()
+        version = (model_version or self.model_version).encode("ascii", errors="replace")[:16]
+        categories = tuple(encode_category(column, getattr(data, column)) for column in CATEGORICAL_COLUMNS)
+        scores = tuple(getattr(data, column) for column in NUMERICAL_COLUMNS)
+
+        with self._lock:
+            if self._head - self._tail >= self.config.buffer_size:
+                self.dropped += 1
+                return False
+            self._buffer[self._head % self.config.buffer_size] = (
+                timestamp, categories, scores, prediction, version
+            )
+            self._head += 1
+        return True
+
+    def flush(self) -> int:
+        """
+        Écrit sur disque les enregistrements en attente dans le tampon.
+
+        Returns:
+            int: Nombre d'enregistrements écrits.
+
+        Raises:
+            MyException: En cas d'erreur d'écriture.
+        """
+        with self._flush_lock:
+            try:
+                with self._lock:
+                    head, tail = self._head, self._tail
+                if head == tail:
+                    return 0
+
+                # Les cases [tail, head) ne peuvent pas être réécrites tant que `_tail` n'avance pas,
+                # on peut donc les copier sur disque sans tenir le verrou des écrivains.
+                capacity = self.config.buffer_size
+                start, stop = tail % capacity, head % capacity
+                if start < stop:
+                    chunks = [self._buffer[start:stop]]
+                else:
+                    chunks = [self._buffer[start:], self._buffer[:stop]]
+
+                for chunk in chunks:
+                    self._write(chunk)
+                self._segment_file.flush()
+
+                with self._lock:
+                    self._tail = head
+                return head - tail
+
+            except Exception as e:
+                logging.error(f"Erreur lors de l'écriture du journal des prédictions : {e}")
+                raise MyException(e, sys)
+
+    def close(self) -> None:
+        """Arrête le thread de vidage et écrit les enregistrements restants."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+        logging.info(f"Journal des prédictions fermé : {self._tail} enregistrements écrits, {self.dropped} abandonnés")
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.config.flush_interval):
+            try:
+                self.flush()
+            except MyException:
+                # L'erreur est déjà journalisée ; on réessaiera au prochain intervalle
+                pass
+
+    def _write(self, records: np.ndarray) -> None:
+        # Le lot est découpé à la limite du segment ; un segment contient au moins un enregistrement
+        itemsize = RECORD_DTYPE.itemsize
+        while len(records):
+            if self._segment_file is None or (
+                self._segment_file.tell() > 0
+                and self._segment_file.tell() + itemsize > self.config.segment_max_bytes
+            ):
+                self._open_segment()
+            room = max(1, (self.config.segment_max_bytes - self._segment_file.tell()) // itemsize)
+            self._segment_file.write(records[:room].tobytes())
+            records = records[room:]
+
+    def _open_segment(self) -> None:
+        if self._segment_file is not None:
+            self._segment_file.close()
+        os.makedirs(self.config.log_dir, exist_ok=True)
+        # Le pid évite les collisions lorsque plusieurs workers écrivent dans le même dossier
+        segment_name = "segment_{0}_{1}_{2:05d}.bin".format(
+            datetime.now().strftime('%Y%m%d_%H%M%S'), os.getpid(), self._segment_index
+        )
+        self._segment_index += 1
+        segment_path = os.path.join(self.config.log_dir, segment_name)
+        self._segment_file = open(segment_path, "ab")
+        logging.info(f"Nouveau segment du journal des prédictions : {segment_path}")
+
+
+def load_segments(log_dir: str):
+    """
+    Projette en mémoire (memory-map) chaque segment du journal sous forme de tableau NumPy.
+
+    Args:
+        log_dir (str): Dossier contenant les segments.
+
+    Returns:
+        List[np.memmap]: Un tableau structuré `RECORD_DTYPE` par segment, trié par nom.
+
+    Raises:
+        MyException: En cas d'erreur de lecture.
+    """
+    try:
+        segments = []
+        for segment_path in sorted(glob.glob(os.path.join(log_dir, SEGMENT_PATTERN))):
+            # Un segment en cours d'écriture peut se terminer par un enregistrement partiel
+            n_records = os.path.getsize(segment_path) // RECORD_DTYPE.itemsize
+            if n_records == 0:
+                continue
+            segments.append(np.memmap(segment_path, dtype=RECORD_DTYPE, mode="r", shape=(n_records,)))
+        return segments
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def read_prediction_log(log_dir: str) -> np.ndarray:
+    """
+    Lit l'ensemble du journal des prédictions dans un seul tableau NumPy.
+
+    Args:
+        log_dir (str): Dossier contenant les segments.
+
+    Returns:
+        np.ndarray: Tableau structuré `RECORD_DTYPE` contenant tous les enregistrements.
+    """
+    segments = load_segments(log_dir)
+    if not segments:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.concatenate(segments)
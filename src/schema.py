@@ -0,0 +1,138 @@
+"""
+Schéma de référence du jeu de données des étudiants.
+
+Centralise le nom des colonnes et les modalités connues des variables
+catégoriques (définis dans `src.columns`) ainsi que le schéma compact, afin que
+l'entraînement, le service et les outils hors ligne encodent les données de la même façon.
+"""
+
+import pandas as pd
+
+from src.columns import (  # noqa: F401 (réexportés)
+    CATEGORICAL_COLUMNS,
+    CATEGORY_LEVELS,
+    DATASET_COLUMNS,
+    NUMERICAL_COLUMNS,
+    TARGET_COLUMN,
+    encode_category,
+)
+
+
+def get_compact_dtypes() -> dict:
+    """
+    Retourne le schéma de lecture compact du jeu de données.
+
+    Les variables catégoriques utilisent le type pandas `category` limité aux modalités
+    connues et les scores, compris entre 0 et 100, un entier non signé 8 bits nullable
+    afin de conserver les valeurs manquantes. Utiliser `apply_compact_dtypes` pour la
+    conversion : elle vérifie que les valeurs sont représentables avant de convertir.
+
+    Returns:
+        dict: Dictionnaire `{colonne: dtype}` utilisable avec `pd.read_csv(dtype=...)`.
+    """
+    dtypes = {column: pd.CategoricalDtype(levels) for column, levels in CATEGORY_LEVELS.items()}
+    for column in NUMERICAL_COLUMNS + [TARGET_COLUMN]:
+        dtypes[column] = "UInt8"
+    return dtypes
+
+
+def validate_categories(df: pd.DataFrame, source: str = "DataFrame") -> None:
+    """
+    Vérifie que les variables catégoriques ne contiennent que des modalités connues.
+
+    Args:
+        df (pd.DataFrame): Données à vérifier.
+        source (str): Nom de la source, repris dans le message d'erreur.
+
+    Raises:
+        ValueError: Si une colonne contient une modalité absente de `CATEGORY_LEVELS`.
+    """
+    errors = []
+    for column, levels in CATEGORY_LEVELS.items():
+        if column not in df.columns:
+            continue
+        unknown = set(df[column].dropna().unique()) - set(levels)
+        if unknown:
+            errors.append(f"'{column}' : {sorted(map(str, unknown))}")
+    if errors:
+        raise ValueError(f"Modalités inconnues dans {source} : " + ", ".join(errors))
+
+
+def validate_scores(df: pd.DataFrame, source: str = "DataFrame") -> None:
+    """
+    Vérifie que les scores sont des entiers compris entre 0 et 100 (valeurs manquantes acceptées).
+
+    Args:
+        df (pd.DataFrame): Données à vérifier.
+        source (str): Nom de la source, repris dans le message d'erreur.
+
+    Raises:
+        ValueError: Si une colonne de score n'est pas numérique ou contient une valeur non représentable en UInt8.
+    """
+    for column in NUMERICAL_COLUMNS + [TARGET_COLUMN]:
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if values.empty:
+            # Un CSV réduit à son en-tête donne des colonnes vides de type object
+            continue
+        if not pd.api.types.is_numeric_dtype(values):
+            raise ValueError(f"La colonne '{column}' de {source} n'est pas numérique ({values.dtype}).")
+        values = values.dropna()
+        invalid = values[(values % 1 != 0) | (values < 0) | (values > 100)]
+        if len(invalid):
+            raise ValueError(
+                f"Scores non entiers ou hors de [0, 100] dans la colonne '{column}' de {source} : "
+                f"{invalid.unique()[:10].tolist()}"
+            )
+
+
+def apply_compact_dtypes(df: pd.DataFrame, source: str = "DataFrame") -> pd.DataFrame:
+    """
+    Convertit les colonnes connues d'un DataFrame vers le schéma compact.
+
+    Les valeurs sont vérifiées avant la conversion : une modalité inconnue deviendrait
+    silencieusement manquante et un score non entier ferait échouer la conversion.
+
+    Args:
+        df (pd.DataFrame): Données lues avec les types par défaut.
+        source (str): Nom de la source, repris dans les messages d'erreur.
+
+    Returns:
+        pd.DataFrame: Données converties (les colonnes hors schéma sont conservées telles quelles).
+
+    Raises:
+        ValueError: Si une valeur n'est pas représentable dans le schéma compact.
+    """
+    validate_categories(df, source)
+    validate_scores(df, source)
+    return df.astype({column: dtype for column, dtype in get_compact_dtypes().items() if column in df.columns})
+
+
+def read_dataset(file_path: str, compact: bool = False, **kwargs) -> pd.DataFrame:
+    """
+    Lit un CSV du jeu de données, avec les types par défaut ou le schéma compact.
+
+    En mode compact, les variables catégoriques sont lues en `category` sans modalités
+    imposées (les valeurs d'origine sont conservées pour la vérification), puis converties
+    avec `apply_compact_dtypes` ; l'analyse directe en entiers nullables est nettement plus
+    lente que la lecture en int64 suivie d'une conversion.
+
+    Args:
+        file_path (str): Chemin du fichier CSV.
+        compact (bool): Utiliser le schéma compact.
+        **kwargs: Arguments supplémentaires transmis à `pd.read_csv`.
+
+    Returns:
+        pd.DataFrame: Les données lues, ou un itérateur de DataFrames si `chunksize` est fourni.
+
+    Raises:
+        ValueError: En mode compact, si une valeur n'est pas représentable dans le schéma compact.
+    """
+    if not compact:
+        return pd.read_csv(file_path, **kwargs)
+
+    result = pd.read_csv(file_path, dtype={column: "category" for column in CATEGORICAL_COLUMNS}, **kwargs)
+    if isinstance(result, pd.DataFrame):
+        return apply_compact_dtypes(result, file_path)
+    return (apply_compact_dtypes(chunk, file_path) for chunk in result)